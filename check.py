@@ -3,16 +3,418 @@ import time
 import json
 import string
 import itertools
+import atexit
+import queue
+import random
+import threading
 from datetime import datetime
+from urllib.parse import urlsplit
 import sys
 
+try:
+    import socks  # PySocks - only needed for SOCKS proxies
+except ImportError:
+    socks = None
+
+class ProxyPoolExhausted(Exception):
+    """Raised when every proxy in the pool is quarantined"""
+    def __init__(self, retry_after):
+        super().__init__(f"All proxies quarantined - next one frees up in {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+class ProxyPool:
+    """Rotate requests across HTTP/SOCKS proxies with per-proxy rate limits and health scoring"""
+    HTTP_SCHEMES = ('http', 'https')
+    SOCKS_SCHEMES = ('socks4', 'socks4a', 'socks5', 'socks5h')
+    
+    def __init__(self, proxies, requests_per_second=1.0, quarantine_after=3, quarantine_seconds=300):
+        self.requests_per_second = requests_per_second
+        self.quarantine_after = quarantine_after
+        self.quarantine_seconds = quarantine_seconds
+        self.started_at = None  # set on the first acquire so setup time doesn't count
+        self.lock = threading.Lock()
+        self.proxies = []
+        created_at = time.monotonic()
+        
+        for url in proxies:
+            url = url.strip()
+            if not url or url.startswith('#'):
+                continue
+            # Bare host:port entries are treated as HTTP proxies
+            if '://' not in url:
+                url = f"http://{url}"
+            # Never show user:pass@ credentials in stats or output
+            parts = urlsplit(url)
+            if parts.scheme not in self.HTTP_SCHEMES + self.SOCKS_SCHEMES:
+                raise ValueError(f"Unsupported proxy scheme '{parts.scheme}' in {parts.scheme}://{parts.hostname}")
+            if parts.scheme in self.SOCKS_SCHEMES and socks is None:
+                raise ValueError("SOCKS proxies need PySocks - run: pip install requests[socks]")
+            if not parts.hostname:
+                raise ValueError(f"Proxy entry has no host: {parts.scheme}://")
+            display_url = f"{parts.scheme}://{parts.hostname}" + (f":{parts.port}" if parts.port else "")
+            self.proxies.append({
+                'url': url,
+                'display_url': display_url,
+                'tokens': 1.0,
+                'last_refill': created_at,
+                'latency': 1.0,        # moving average in seconds
+                'error_rate': 0.0,     # moving average of failed requests
+                'requests': 0,
+                'successes': 0,
+                'blocks': 0,
+                'errors': 0,
+                'consecutive_failures': 0,
+                'quarantined_until': 0.0
+            })
+        
+        if not self.proxies:
+            raise ValueError("Proxy pool needs at least one proxy")
+    
+    @classmethod
+    def from_file(cls, path, **kwargs):
+        """Load proxies from a file with one proxy URL per line"""
+        with open(path, 'r') as f:
+            return cls(f.readlines(), **kwargs)
+    
+    def _refill(self, proxy, now):
+        """Top up a proxy's token bucket based on time elapsed"""
+        capacity = max(1.0, self.requests_per_second)
+        elapsed = now - proxy['last_refill']
+        proxy['tokens'] = min(capacity, proxy['tokens'] + elapsed * self.requests_per_second)
+        proxy['last_refill'] = now
+    
+    def _score(self, proxy):
+        """Selection weight - fast, healthy exits score higher"""
+        return max(0.01, 1.0 - proxy['error_rate']) / max(0.05, proxy['latency'])
+    
+    def acquire(self):
+        """Pick a proxy with budget left, waiting for one to free up if necessary"""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                ready = []
+                wait = None
+                if self.started_at is None:
+                    self.started_at = now
+                
+                # Don't stall for minutes when every exit is quarantined - let the caller back off
+                if all(proxy['quarantined_until'] > now for proxy in self.proxies):
+                    raise ProxyPoolExhausted(min(proxy['quarantined_until'] for proxy in self.proxies) - now)
+                
+                for proxy in self.proxies:
+                    if proxy['quarantined_until'] > now:
+                        continue
+                    self._refill(proxy, now)
+                    if proxy['tokens'] >= 1.0:
+                        ready.append(proxy)
+                        continue
+                    until_free = (1.0 - proxy['tokens']) / self.requests_per_second
+                    wait = until_free if wait is None else min(wait, until_free)
+                
+                if ready:
+                    proxy = random.choices(ready, weights=[self._score(p) for p in ready])[0]
+                    proxy['tokens'] -= 1.0
+                    proxy['requests'] += 1
+                    return proxy
+            
+            time.sleep(wait)
+    
+    def record(self, proxy, status_code=None, elapsed=None):
+        """Update a proxy's health after a request (status_code None means the request failed)"""
+        alpha = 0.3
+        
+        with self.lock:
+            # Only real responses count towards latency - a refused connection is not a fast exit
+            if status_code is not None and elapsed is not None:
+                proxy['latency'] = (1 - alpha) * proxy['latency'] + alpha * elapsed
+            
+            failed = status_code is None or status_code in (403, 429) or status_code >= 500
+            proxy['error_rate'] = (1 - alpha) * proxy['error_rate'] + alpha * (1.0 if failed else 0.0)
+            
+            if status_code in (403, 429):
+                proxy['blocks'] += 1
+            elif failed:
+                proxy['errors'] += 1
+            else:
+                proxy['successes'] += 1
+            
+            # Blocked or unreachable exits get quarantined once they keep failing
+            if status_code is None or status_code in (403, 429):
+                proxy['consecutive_failures'] += 1
+                if proxy['consecutive_failures'] >= self.quarantine_after:
+                    proxy['quarantined_until'] = time.monotonic() + self.quarantine_seconds
+                    proxy['consecutive_failures'] = 0
+            else:
+                proxy['consecutive_failures'] = 0
+    
+    def get(self, session, url, **kwargs):
+        """Send a GET request through the next proxy in the pool"""
+        proxy = self.acquire()
+        start = time.monotonic()
+        try:
+            response = session.get(url, proxies={'http': proxy['url'], 'https': proxy['url']}, **kwargs)
+        except requests.exceptions.RequestException:
+            self.record(proxy, None)
+            raise
+        self.record(proxy, response.status_code, time.monotonic() - start)
+        return response
+    
+    def get_stats(self):
+        """Return per-proxy throughput and health statistics"""
+        with self.lock:
+            now = time.monotonic()
+            minutes = max(now - (self.started_at or now), 1e-6) / 60
+            return [{
+                'url': proxy['display_url'],
+                'requests': proxy['requests'],
+                'successes': proxy['successes'],
+                'blocks': proxy['blocks'],
+                'errors': proxy['errors'],
+                'requests_per_minute': proxy['requests'] / minutes,
+                'avg_latency_ms': proxy['latency'] * 1000,
+                'health': self._score(proxy),
+                'quarantined': proxy['quarantined_until'] > now
+            } for proxy in self.proxies]
+    
+    def print_stats(self):
+        """Print a per-proxy throughput table"""
+        print("🌐 PROXY STATS:")
+        for stats in self.get_stats():
+            state = "🚫 quarantined" if stats['quarantined'] else "✅ active"
+            print(f"   {stats['url']}: {stats['requests']} req ({stats['requests_per_minute']:.1f}/min) | "
+                  f"OK {stats['successes']} | Blocked {stats['blocks']} | Errors {stats['errors']} | "
+                  f"{stats['avg_latency_ms']:.0f}ms | {state}")
+
+class ConsoleReporter:
+    """Render check events from a background thread so the check loop never waits on stdout"""
+    MODES = ('progress', 'verbose', 'quiet')
+    
+    def __init__(self, mode='verbose', stream=None, refresh_interval=0.25):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown reporter mode: {mode}")
+        self.mode = mode
+        self.verbose = mode == 'verbose'
+        self.stream = stream or sys.stdout
+        self.interactive = hasattr(self.stream, 'isatty') and self.stream.isatty()
+        # Redirected output gets a plain progress line every few seconds instead of redraws
+        self.refresh_interval = refresh_interval if self.interactive else max(refresh_interval, 5.0)
+        self.events = queue.Queue()
+        self.failed = False  # set once the stream can't be written to (e.g. a closed pipe)
+        self.reset()
+        
+        self.thread = None
+        if mode != 'quiet':
+            self.thread = threading.Thread(target=self._run, daemon=True)
+            self.thread.start()
+            # Make sure queued output is written before the interpreter exits
+            atexit.register(self.close)
+    
+    def reset(self, total=0, delay=0.0):
+        """Reset the counters used by the progress display"""
+        self.total = total
+        self.done = 0
+        self.found = 0
+        self.errors = 0
+        self.delay = delay
+        self.started_at = time.monotonic()
+        self.last_render = 0.0
+        self.line_open = False
+    
+    def emit(self, kind, **data):
+        """Queue an event for rendering - never blocks"""
+        if self.thread and not self.failed:
+            self.events.put_nowait((kind, data))
+    
+    def log(self, message):
+        """Queue a free-form message that is only shown in verbose mode"""
+        if self.verbose and self.thread and not self.failed:
+            self.events.put_nowait(('log', {'message': message}))
+    
+    def flush(self):
+        """Wait until every queued event has been rendered"""
+        if self.thread and not self.failed:
+            self.events.join()
+    
+    def close(self):
+        """Render anything still queued and stop the background thread"""
+        thread = self.thread
+        if thread:
+            self.thread = None
+            if not self.failed:
+                self.events.put(('stop', {}))
+            thread.join()
+    
+    def _run(self):
+        while not self.failed:
+            try:
+                kind, data = self.events.get(timeout=self.refresh_interval)
+            except queue.Empty:
+                if self.mode == 'progress' and self.total:
+                    try:
+                        self._write(self._render_progress(force=True))
+                    except Exception:
+                        pass
+                continue
+            
+            # Drain whatever else is pending and write it in one go
+            batch = [(kind, data)]
+            while True:
+                try:
+                    batch.append(self.events.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                output = ''.join(self._handle_safely(kind, data) for kind, data in batch)
+                if self.mode == 'progress' and self.total:
+                    output += self._render_progress()
+                self._write(output)
+            except Exception:
+                # Never let a rendering bug kill the thread - flush() would wait forever
+                pass
+            finally:
+                for _ in batch:
+                    self.events.task_done()
+            
+            if any(kind == 'stop' for kind, _ in batch):
+                return
+        
+        # The stream is gone - release anything still queued so flush() can't hang
+        while True:
+            try:
+                self.events.get_nowait()
+            except queue.Empty:
+                break
+            self.events.task_done()
+    
+    def _handle_safely(self, kind, data):
+        """Render one event, dropping it if it can't be formatted"""
+        try:
+            return self._handle(kind, data)
+        except Exception:
+            return ''
+    
+    def _write(self, output):
+        if output and not self.failed:
+            try:
+                self.stream.write(output)
+                self.stream.flush()
+            except (OSError, ValueError):
+                # Closed pipe or stream (e.g. piped into head) - stop rendering for good
+                self.failed = True
+    
+    def _line(self, text):
+        """Write a full line, clearing an open progress line first"""
+        prefix = ''
+        if self.line_open:
+            prefix = '\r\033[K'
+            self.line_open = False
+        return f"{prefix}{text}\n"
+    
+    def _handle(self, kind, data):
+        if kind == 'start':
+            self.reset(data['total'], data['delay'])
+            return ''
+        
+        if kind == 'log':
+            return self._line(data['message'])
+        
+        if kind == 'notice':
+            return self._line(data['message'])
+        
+        if kind == 'delay':
+            self.delay = data['delay']
+            if self.verbose:
+                return self._line(f"\n⚡ Speed optimized! New delay: {self.delay:.1f}s")
+            return ''
+        
+        if kind == 'result':
+            return self._handle_result(data)
+        
+        if kind == 'finish':
+            # Draw the final progress line once, close it and stop idle redraws
+            output = ''
+            if self.mode == 'progress' and self.total:
+                output = self._render_progress(force=True)
+            if self.line_open:
+                output += '\n'
+                self.line_open = False
+            self.total = 0
+            return output
+        
+        return ''
+    
+    def _handle_result(self, data):
+        result = data['result']
+        status = result['status']
+        self.done = data['index'] + 1
+        self.delay = data['next_delay']
+        
+        if status == 'success' and result['available']:
+            self.found += 1
+        elif status != 'success':
+            self.errors += 1
+        
+        idle_text = " (idle user)" if result['belongs_to_idle_user'] else ""
+        if not self.verbose:
+            if status == 'success' and result['available']:
+                return self._line(f"✅ AVAILABLE: {result['name']}{idle_text}")
+            return ''
+        
+        # With a proxy pool there is no delay to report
+        delay_text = f" - increasing delay to {self.delay:.1f}s" if self.delay is not None else ""
+        if status == 'error_429_rate_limit':
+            outcome = f"⏱️  RATE LIMITED{delay_text}"
+        elif status == 'error_403_blocked':
+            outcome = f"🚫 BLOCKED{delay_text}"
+        elif status == 'success':
+            outcome = f"✅ AVAILABLE{idle_text}" if result['available'] else "❌ TAKEN"
+        else:
+            outcome = f"⚠️  ERROR ({status})"
+        
+        delay_indicator = f"({data['delay']:.1f}s)" if data['delay_changed'] else ""
+        output = self._line(f"[{self.done:4d}/{self.total}] {delay_indicator} Checking: {result['name']}... {outcome}")
+        
+        # Show summary progress every 25 checks
+        if self.done % 25 == 0:
+            progress = (self.done / self.total) * 100
+            speed_text = f" | Current Speed: {self.delay:.1f}s" if self.delay is not None else ""
+            output += self._line(f"\n📊 Progress: {progress:.1f}% | New Available: {self.found} | "
+                                 f"Total Available: {data['total_available']}{speed_text}")
+            output += self._line("-" * 60)
+        return output
+    
+    def _render_progress(self, force=False):
+        """Throttled single-line progress display with rate and ETA"""
+        now = time.monotonic()
+        if not force and now - self.last_render < self.refresh_interval:
+            return ''
+        self.last_render = now
+        
+        elapsed = max(now - self.started_at, 1e-6)
+        rate = self.done / elapsed
+        remaining = self.total - self.done
+        eta = time.strftime('%H:%M:%S', time.gmtime(remaining / rate)) if rate > 0 else '--:--:--'
+        progress = (self.done / self.total) * 100
+        text = (f"[{self.done}/{self.total}] {progress:.1f}% | {rate:.1f} names/s | ETA {eta} | "
+                f"Found {self.found} | Errors {self.errors}")
+        if self.delay is not None:
+            text += f" | Delay {self.delay:.1f}s"
+        
+        if self.interactive:
+            self.line_open = True
+            return f"\r\033[K{text}"
+        return f"{text}\n"
+
 class FaceitNameChecker:
-    def __init__(self, cookies=None):
+    def __init__(self, cookies=None, proxy_pool=None, reporter=None):
         self.base_url = "https://www.faceit.com/api/shop/v2/nickname-availability/"
         self.available_names = []
         self.checked_count = 0
         self.total_count = 0
         self.session = requests.Session()
+        self.proxy_pool = proxy_pool
+        self.reporter = reporter or ConsoleReporter('verbose')
         
         # File paths for persistence
         self.checked_names_file = "checked_names.txt"
@@ -39,26 +441,31 @@ class FaceitNameChecker:
         if cookies:
             self.session.headers['Cookie'] = cookies
             print("✅ Using provided authentication cookies")
+        
+        if proxy_pool:
+            print(f"🌐 Routing checks through {len(proxy_pool.proxies)} proxies")
+    
+    def _get(self, url, **kwargs):
+        """GET through the proxy pool if one is configured, otherwise directly"""
+        if self.proxy_pool:
+            return self.proxy_pool.get(self.session, url, **kwargs)
+        return self.session.get(url, **kwargs)
     
     def check_name_availability(self, name, max_retries=3):
         """Check if a name is available on FACEIT with retry logic"""
         for attempt in range(max_retries):
             try:
                 url = f"{self.base_url}{name}"
-                response = self.session.get(url, timeout=15)
+                response = self._get(url, timeout=15)
                 
                 if response.status_code == 200:
                     try:
-                        # Debug response details
-                        content_encoding = response.headers.get('content-encoding', 'none')
-                        content_type = response.headers.get('content-type', 'unknown')
-                        
-                        # Check if response is properly decompressed
-                        if len(response.content) != len(response.text.encode('utf-8')):
-                            print(f"\n🔍 Compression issue detected for {name}")
-                            print(f"    Content-Encoding: {content_encoding}")
-                            print(f"    Raw content length: {len(response.content)}")
-                            print(f"    Text length: {len(response.text)}")
+                        # Check if response is properly decompressed (only worth the re-encode when it will be shown)
+                        if self.reporter.verbose and len(response.content) != len(response.text.encode('utf-8')):
+                            self.reporter.log(f"\n🔍 Compression issue detected for {name}\n"
+                                              f"    Content-Encoding: {response.headers.get('content-encoding', 'none')}\n"
+                                              f"    Raw content length: {len(response.content)}\n"
+                                              f"    Text length: {len(response.text)}")
                         
                         data = response.json()
                         payload = data.get('payload', {})
@@ -72,12 +479,13 @@ class FaceitNameChecker:
                             'status': 'success'
                         }
                     except (json.JSONDecodeError, ValueError) as e:
-                        print(f"\n🔍 Got HTTP 200 but invalid JSON for {name}")
-                        print(f"    JSON Error: {e}")
-                        print(f"    Content-Type: {response.headers.get('content-type', 'unknown')}")
-                        print(f"    Content-Encoding: {response.headers.get('content-encoding', 'none')}")
-                        print(f"    Response length: {len(response.content)} bytes")
-                        print(f"    First 100 bytes (hex): {response.content[:100].hex()}")
+                        if self.reporter.verbose:
+                            self.reporter.log(f"\n🔍 Got HTTP 200 but invalid JSON for {name}\n"
+                                              f"    JSON Error: {e}\n"
+                                              f"    Content-Type: {response.headers.get('content-type', 'unknown')}\n"
+                                              f"    Content-Encoding: {response.headers.get('content-encoding', 'none')}\n"
+                                              f"    Response length: {len(response.content)} bytes\n"
+                                              f"    First 100 bytes (hex): {response.content[:100].hex()}")
                         
                         # Try to decode manually if it's compressed
                         try:
@@ -91,7 +499,7 @@ class FaceitNameChecker:
                                 is_available = payload.get('available', False)
                                 belongs_to_idle = payload.get('belongs_to_idle_user', False)
                                 
-                                print(f"    ✅ Manual gzip decompression successful!")
+                                self.reporter.log("    ✅ Manual gzip decompression successful!")
                                 return {
                                     'name': name,
                                     'available': is_available,
@@ -99,7 +507,7 @@ class FaceitNameChecker:
                                     'status': 'success'
                                 }
                         except Exception as decomp_error:
-                            print(f"    Manual decompression failed: {decomp_error}")
+                            self.reporter.log(f"    Manual decompression failed: {decomp_error}")
                         
                         return {
                             'name': name,
@@ -109,8 +517,9 @@ class FaceitNameChecker:
                         }
                 elif response.status_code == 403:
                     if attempt < max_retries - 1:
-                        # Wait longer on 403 and retry
-                        time.sleep(2 * (attempt + 1))
+                        # Wait longer on 403 and retry (the pool retries on another exit instead)
+                        if not self.proxy_pool:
+                            time.sleep(2 * (attempt + 1))
                         continue
                     else:
                         return {
@@ -121,7 +530,8 @@ class FaceitNameChecker:
                         }
                 elif response.status_code == 429:  # Rate limited
                     if attempt < max_retries - 1:
-                        time.sleep(5 * (attempt + 1))
+                        if not self.proxy_pool:
+                            time.sleep(5 * (attempt + 1))
                         continue
                     else:
                         return {
@@ -131,7 +541,8 @@ class FaceitNameChecker:
                             'status': 'error_429_rate_limit'
                         }
                 else:
-                    print(f"\n🔍 HTTP {response.status_code} for {name}: {response.text[:200]}")
+                    if self.reporter.verbose:
+                        self.reporter.log(f"\n🔍 HTTP {response.status_code} for {name}: {response.text[:200]}")
                     return {
                         'name': name,
                         'available': False,
@@ -139,16 +550,26 @@ class FaceitNameChecker:
                         'status': f'error_{response.status_code}'
                     }
                     
+            except ProxyPoolExhausted as e:
+                return {
+                    'name': name,
+                    'available': False,
+                    'belongs_to_idle_user': False,
+                    'status': 'error_proxies_quarantined',
+                    'retry_after': e.retry_after
+                }
             except requests.exceptions.JSONDecodeError as e:
-                print(f"\n🔍 JSON decode error for {name}: {e}")
-                try:
-                    print(f"    Raw response: {response.text[:300]}")
-                    print(f"    Status code: {response.status_code}")
-                    print(f"    Headers: {dict(response.headers)}")
-                except:
-                    print("    Could not access response details")
+                if self.reporter.verbose:
+                    details = f"\n🔍 JSON decode error for {name}: {e}\n"
+                    try:
+                        details += (f"    Raw response: {response.text[:300]}\n"
+                                    f"    Status code: {response.status_code}\n"
+                                    f"    Headers: {dict(response.headers)}")
+                    except:
+                        details += "    Could not access response details"
+                    self.reporter.log(details)
                 if attempt < max_retries - 1:
-                    print(f"   Retrying in {1 * (attempt + 1)} seconds...")
+                    self.reporter.log(f"   Retrying in {1 * (attempt + 1)} seconds...")
                     time.sleep(1 * (attempt + 1))
                     continue
                 else:
@@ -159,9 +580,9 @@ class FaceitNameChecker:
                         'status': 'error_json_decode'
                     }
             except requests.exceptions.RequestException as e:
-                print(f"\n🔍 Request error for {name}: {type(e).__name__}: {e}")
+                self.reporter.log(f"\n🔍 Request error for {name}: {type(e).__name__}: {e}")
                 if attempt < max_retries - 1:
-                    print(f"   Retrying in {1 * (attempt + 1)} seconds...")
+                    self.reporter.log(f"   Retrying in {1 * (attempt + 1)} seconds...")
                     time.sleep(1 * (attempt + 1))
                     continue
                 else:
@@ -366,68 +787,70 @@ class FaceitNameChecker:
         
         self.total_count = len(unchecked_names)
         print(f"Starting check for {self.total_count} names...")
-        print(f"🚀 Dynamic delay: Starting at {initial_delay}s, decreasing by 0.1s every 10 requests")
-        print(f"⚡ Minimum delay: 0.5s to avoid rate limits")
+        if self.proxy_pool:
+            print(f"🌐 Proxy pool: {len(self.proxy_pool.proxies)} exits at {self.proxy_pool.requests_per_second} req/s each")
+        else:
+            print(f"🚀 Dynamic delay: Starting at {initial_delay}s, decreasing by 0.1s every 10 requests")
+            print(f"⚡ Minimum delay: 0.5s to avoid rate limits")
         print("=" * 60)
         
         new_available_count = 0
-        current_delay = initial_delay
+        # The proxy pool paces each exit itself, so the dynamic delay only applies to direct connections
+        current_delay = None if self.proxy_pool else initial_delay
         min_delay = 0.5
         
+        self.reporter.emit('start', total=self.total_count, delay=current_delay)
+        
         for i, name in enumerate(unchecked_names):
             # Dynamically adjust delay - decrease by 0.1s every 10 requests
-            if i > 0 and i % 10 == 0 and current_delay > min_delay:
+            if current_delay is not None and i > 0 and i % 10 == 0 and current_delay > min_delay:
                 current_delay = max(min_delay, current_delay - 0.1)
-                print(f"\n⚡ Speed optimized! New delay: {current_delay:.1f}s")
-            
-            # Show what we're checking
-            delay_indicator = f"({current_delay:.1f}s)" if current_delay != initial_delay else ""
-            print(f"[{i + 1:4d}/{self.total_count}] {delay_indicator} Checking: {name}...", end=" ")
+                self.reporter.emit('delay', delay=current_delay)
             
+            check_delay = current_delay
             result = self.check_name_availability(name)
             
             # Check for rate limiting and adjust delay accordingly
-            if result['status'] == 'error_429_rate_limit':
-                current_delay = min(current_delay + 0.5, 3.0)  # Increase delay if rate limited
-                print(f"⏱️  RATE LIMITED - increasing delay to {current_delay:.1f}s")
-            elif result['status'] == 'error_403_blocked':
-                current_delay = min(current_delay + 1.0, 5.0)  # Increase delay more for 403
-                print(f"🚫 BLOCKED - increasing delay to {current_delay:.1f}s")
+            if result['status'] in ('error_429_rate_limit', 'error_403_blocked', 'error_proxies_quarantined'):
+                if current_delay is not None and result['status'] == 'error_429_rate_limit':
+                    current_delay = min(current_delay + 0.5, 3.0)  # Increase delay if rate limited
+                elif current_delay is not None and result['status'] == 'error_403_blocked':
+                    current_delay = min(current_delay + 1.0, 5.0)  # Increase delay more for 403
             else:
                 # Save that we checked this name
                 self.save_checked_name(name)
                 
-                if result['status'] == 'success':
-                    if result['available']:
-                        self.available_names.append(result)
-                        self.save_available_name(result)
-                        new_available_count += 1
-                        idle_text = " (idle user)" if result['belongs_to_idle_user'] else ""
-                        print(f"✅ AVAILABLE{idle_text}")
-                    else:
-                        print("❌ TAKEN")
-                else:
-                    print(f"⚠️  ERROR ({result['status']})")
+                if result['status'] == 'success' and result['available']:
+                    self.available_names.append(result)
+                    self.save_available_name(result)
+                    new_available_count += 1
             
-            # Show summary progress every 25 checks
-            if (i + 1) % 25 == 0:
-                progress = ((i + 1) / self.total_count) * 100
-                total_available = len(self.available_names)
-                print(f"\n📊 Progress: {progress:.1f}% | New Available: {new_available_count} | Total Available: {total_available} | Current Speed: {current_delay:.1f}s")
-                print("-" * 60)
+            self.reporter.emit('result', index=i, result=result, delay=check_delay, next_delay=current_delay,
+                               delay_changed=check_delay is not None and check_delay != initial_delay,
+                               total_available=len(self.available_names))
             
-            # Add dynamic delay
-            time.sleep(current_delay)
+            # Back off until a proxy leaves quarantine, otherwise add dynamic delay
+            if result['status'] == 'error_proxies_quarantined':
+                self.reporter.emit('notice', message=f"🚫 All proxies quarantined - pausing {result['retry_after']:.0f}s")
+                time.sleep(result['retry_after'])
+            elif current_delay is not None:
+                time.sleep(current_delay)
+        
+        self.reporter.emit('finish')
+        self.reporter.flush()
         
         print(f"\n{'='*60}")
         print(f"✅ Check completed!")
         print(f"📈 Names checked this session: {self.total_count}")
         print(f"🆕 New available names found: {new_available_count}")
         print(f"🎯 Total available names: {len(self.available_names)}")
-        print(f"⚡ Final delay: {current_delay:.1f}s (started at {initial_delay}s)")
+        if current_delay is not None:
+            print(f"⚡ Final delay: {current_delay:.1f}s (started at {initial_delay}s)")
         if new_available_count > 0:
             success_rate = (new_available_count / self.total_count) * 100
             print(f"📊 Success rate this session: {success_rate:.1f}%")
+        if self.proxy_pool:
+            self.proxy_pool.print_stats()
 
 def main():
     print("FACEIT Name Availability Checker")
@@ -455,11 +878,30 @@ def main():
     if cf_clearance:
         cookies += f"; cf_clearance={cf_clearance}"
     
-    checker = FaceitNameChecker(cookies)
+    # Optional proxy pool to spread checks across several exit addresses
+    proxy_pool = None
+    proxy_file = input("Proxy list file (blank for direct connection): ").strip()
+    if proxy_file:
+        try:
+            proxy_pool = ProxyPool.from_file(proxy_file)
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not load proxies: {e}")
+            return
+    
+    # Output mode - the progress line keeps the terminal from slowing down fast runs
+    output_choice = input("Output mode - (p)rogress, (v)erbose, (q)uiet [p]: ").strip().lower()
+    modes = {'': 'progress', 'p': 'progress', 'v': 'verbose', 'q': 'quiet'}
+    if output_choice not in modes:
+        print("❌ Invalid output mode")
+        return
+    reporter = ConsoleReporter(modes[output_choice])
+    
+    checker = FaceitNameChecker(cookies, proxy_pool, reporter)
     
     # Test connection first
     print("\n🧪 Testing connection...")
     test_result = checker.check_name_availability("test")
+    checker.reporter.flush()
     if test_result['status'] == 'success':
         print("✅ Connection successful!")
     elif 'error_403' in test_result['status']:
@@ -472,6 +914,7 @@ def main():
         urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
         checker.session.verify = False
         test_result = checker.check_name_availability("test")
+        checker.reporter.flush()
         if test_result['status'] == 'success':
             print("✅ Connection successful with SSL verification disabled!")
         else: